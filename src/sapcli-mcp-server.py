@@ -3,11 +3,13 @@ Export sapcli commands as MCP tools.
 """
 
 import argparse
+import json
+import logging
+import os
+import sys
 
 from fastmcp import FastMCP
 
-from sapclimcp.mcptools import transform_sapcli_commands
-
 # List of verified and supported sapcli commands exposed as MCP tools
 VERIFIED_COMMANDS = [
     "abap_package_list",
@@ -54,6 +56,12 @@ def parse_args():
         help="Expose all meaningful sapcli commands as tools (not just verified ones)"
     )
 
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable debug logging (includes the registered tool schemas)"
+    )
+
     return parser.parse_args()
 
 
@@ -67,13 +75,45 @@ def create_mcp_server(name: str = "sapcli", experimental: bool = False) -> FastM
     Returns:
         Initialized FastMCP server with registered sapcli tools.
     """
+    # Imported lazily - pulling in sapclimcp.mcptools drags the whole
+    # sap.cli command tree along, which would slow down plain argument
+    # parsing (e.g. --help) for no benefit.
+    # pylint: disable-next=import-outside-toplevel
+    from sapclimcp.mcptools import transform_sapcli_commands
+
     mcp = FastMCP(name=name, instructions=MCP_SERVER_INSTRUCTIONS)
     allowed_commands = None if experimental else VERIFIED_COMMANDS
     transform_sapcli_commands(mcp, allowed_commands)
     return mcp
 
 
+def _dump_tools(mcp: FastMCP) -> None:
+    """Write the registered tool schemas to stdout, one JSON per line.
+
+    Only meant for troubleshooting; the whole dump is emitted with a
+    single buffered write so large catalogs do not stall startup with
+    per-line flushes.
+    """
+    tools = getattr(getattr(mcp, "_tool_manager", None), "_tools", None)
+    if not tools:
+        return
+
+    lines = [
+        json.dumps(
+            {"name": name, "parameters": tool.parameters},
+            separators=(",", ":"),
+            default=str,
+        )
+        for name, tool in tools.items()
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 if __name__ == "__main__":
     args = parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
     server = create_mcp_server(experimental=args.experimental)
+
+    if os.environ.get("SAPCLI_MCP_DUMP_TOOLS"):
+        _dump_tools(server)
     server.run(transport="http", host="127.0.0.1", port=8000)
@@ -1,10 +1,21 @@
 import builtins
+import functools
+import linecache
+import os
+import sys
 
+from collections import ChainMap
 from dataclasses import dataclass, field
 from types import SimpleNamespace
 from typing import Any, FrozenSet, Set, Union
 
 
+# Keep the raw add_argument kwargs per parameter for inspection. Off by
+# default - the mirror doubles the dict memory of the parser tree and
+# nothing on the runtime path reads it.
+_DEBUG_KEEP_KWARGS = bool(os.environ.get('SAPCLIMCP_DEBUG_KWARGS'))
+
+
 class ArgToToolConversionError(Exception):
 
     def __init__(self, message):
@@ -17,50 +28,93 @@ class MissingArgument(Exception):
         super().__init__(message)
 
 
+# Scalar and array JSON specs for all supported builtin types. The entries
+# are shared between properties and must never be mutated in place -
+# _add_default_if_specified builds a new dict when it needs to extend one.
+_TYPE_TO_SPEC = {
+    builtins.bool: {'type': 'boolean'},
+    builtins.str: {'type': 'string'},
+    builtins.int: {'type': 'integer'},
+}
+
+_TYPE_TO_ARRAY_SPEC = {
+    typ: {'type': 'array', 'items': spec}
+    for typ, spec in _TYPE_TO_SPEC.items()
+}
+
+
 def _add_default_if_specified(spec, default):
     if default is not None:
-        spec['default'] = default
+        return {**spec, 'default': default}
 
     return spec
 
 
-def _builtin_to_spec(builtinTyp):
-    match builtinTyp:
-        case builtins.bool:
-            return {'type': 'boolean'}
-        case builtins.str:
-            return {'type': 'string'}
-        case builtins.int:
-            return {'type': 'integer'}
-        case _:
-            raise ArgToToolConversionError('Unsupported type: ' + str(builtinTyp))
+def _builtin_to_spec(builtinTyp, table=_TYPE_TO_SPEC):
+    try:
+        return table[builtinTyp]
+    except KeyError:
+        raise ArgToToolConversionError('Unsupported type: ' + str(builtinTyp)) from None
 
 
-def _argument_spec_to_json_spec(argparserArgument):
-    action = argparserArgument.get('action', None)
-    typ = argparserArgument.get('type', None)
-    nargs = argparserArgument.get('nargs', '')
+def _bool_spec(_typ):
+    return _TYPE_TO_SPEC[bool]
+
+
+def _count_spec(_typ):
+    return _TYPE_TO_SPEC[int]
+
+
+def _scalar_spec(typ):
+    # No action given: an untyped argument captures a string.
+    if typ is None:
+        return _TYPE_TO_SPEC[str]
+
+    return _builtin_to_spec(typ)
+
+
+def _typed_spec(typ):
+    # Unknown action: the spec comes strictly from the declared type.
+    return _builtin_to_spec(typ)
+
 
+# Handler per argparse action; adding support for a new action is one
+# entry here.
+_ACTION_HANDLERS = {
+    'store_true': _bool_spec,
+    'store_false': _bool_spec,
+    'count': _count_spec,
+    None: _scalar_spec,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _spec_for(action, typ, nargs):
+    """Resolve the shared spec for one (action, type, nargs) shape.
+
+    Argument shapes across the sapcli command tree are massively
+    repetitive, so after the first few calls every lookup is a cache
+    hit instead of a dispatch.
+    """
+
+    # Arrays take precedence over the action dispatch - argparse treats
+    # nargs='+'/'*' as list-producing regardless of the action.
     if (action == 'append') or (nargs in ['+', '*']):
-        if typ is None:
-            item_spec = _builtin_to_spec(str)
-        else:
-            item_spec = _builtin_to_spec(typ)
-        spec = {'type': 'array', 'items': item_spec }
-    elif action in ['store_true', 'store_false']:
-        spec = _builtin_to_spec(bool)
-    elif action in ['count']:
-        spec = _builtin_to_spec(int)
-    elif (action is None and typ is None):
-        spec = _builtin_to_spec(str)
-    else:
-        spec = _builtin_to_spec(typ)
+        return _builtin_to_spec(typ if typ is not None else str, table=_TYPE_TO_ARRAY_SPEC)
+
+    return _ACTION_HANDLERS.get(action, _typed_spec)(typ)
+
+
+def _argument_spec_to_json_spec(argparserArgument):
+    spec = _spec_for(argparserArgument.get('action', None),
+                     argparserArgument.get('type', None),
+                     argparserArgument.get('nargs', ''))
 
     default = argparserArgument.get('default', None)
     return _add_default_if_specified(spec, default)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArgPaserToolInputSchema:
     properties: dict[str, Any] = field(default_factory=dict)
     required: list[str] = field(default_factory=list)
@@ -86,6 +140,13 @@ class ArgParserTool:
        be stored in the member cmdfn.
     """
 
+    # One instance exists per sapcli (sub)command, so the per-instance
+    # __dict__ savings scale with the command tree. __weakref__ keeps
+    # the instances usable as weak-cache keys.
+    __slots__ = ('name', 'cmdfn', 'conn_factory', 'input_schema', 'tools',
+                 '_parent', '_root', '_parameters', '_cached_input_schema',
+                 '_fast_parse_args', '_frozen', '_required_set', '__weakref__')
+
     def __init__(self, name, parent, conn_factory=None):
         self.name = name
         self.cmdfn = None
@@ -94,11 +155,20 @@ class ArgParserTool:
         self.tools = {}
 
         self._parent = parent
-        self._parameters = {}
+        self._root = parent._root if parent is not None else self
+        self._parameters = {} if _DEBUG_KEEP_KWARGS else None
+        self._cached_input_schema = None
+        self._fast_parse_args = None
+        self._frozen = False
+        # Mirror of input_schema.required for O(1) duplicate checks
+        self._required_set = set()
 
     def add_argument(self, *args, **kwargs):
         """Convert command line argument to MCP Tool input property"""
 
+        if self._frozen:
+            raise ArgToToolConversionError(self.name + ': cannot add argument to a frozen tool')
+
         # Property name - use this one if it is a possitional argument (no --)
         parameter = args[0]
 
@@ -112,13 +182,28 @@ class ArgParserTool:
             # Also replace dashes with underscores (matching argparse behavior)
             parameter = parameter.lstrip('-').replace('-', '_')
 
+        # The same ~10 parameter names repeat across hundreds of
+        # subtools; interning shares one string object per name and
+        # makes the dict-key comparisons pointer checks.
+        parameter = sys.intern(parameter)
+
         # Save the original configuration for debugging purposes
-        self._parameters[parameter] = kwargs
+        if self._parameters is not None:
+            self._parameters[parameter] = kwargs
         try:
-            self.input_schema.properties[parameter] = _argument_spec_to_json_spec(kwargs)
+            spec = _argument_spec_to_json_spec(kwargs)
         except ArgToToolConversionError as ex:
             raise ArgToToolConversionError(self.name + " " + parameter + ': ' + str(ex) + " " + str(kwargs))
 
+        # sapcli subcommands systematically redeclare inherited
+        # connection flags; when the spec comes out identical there is
+        # nothing to store and the caches stay valid.
+        existing = self.input_schema.properties.get(parameter)
+        if existing is not spec and existing != spec:
+            self.input_schema.properties[parameter] = spec
+            self._cached_input_schema = None
+            self._fast_parse_args = None
+
         hasdefault = 'default' in kwargs
         # nargs='?' or nargs='*' means the argument is optional
         optional_nargs = kwargs.get('nargs') in ['?', '*']
@@ -126,8 +211,11 @@ class ArgParserTool:
         # and is not optional due to nargs
         required = kwargs.get('required', not hasdefault and not optional_nargs)
 
-        if required:
+        if required and parameter not in self._required_set:
             self.input_schema.required.append(parameter)
+            self._required_set.add(parameter)
+            self._cached_input_schema = None
+            self._fast_parse_args = None
 
     def set_defaults(self, **kwargs):
         if len(kwargs.keys()) != 1 or 'execute' not in kwargs:
@@ -149,26 +237,38 @@ class ArgParserTool:
         subtool_name = self.name + "_" + name
         subtool = ArgParserTool(subtool_name, self, conn_factory=self.conn_factory)
 
-        # Inherit parent's properties
-        for prop_name, prop_spec in self.input_schema.properties.items():
-            subtool.input_schema.properties[prop_name] = prop_spec.copy()
+        # Inherit parent's properties without copying them - the ChainMap
+        # shadows the parent layer, so writes into the subtool land in its
+        # own front map and never leak back.
+        subtool.input_schema.properties = ChainMap({}, self.input_schema.properties)
         subtool.input_schema.required.extend(self.input_schema.required)
+        subtool._required_set = set(subtool.input_schema.required)
 
         self._add_subtool(subtool)
         return subtool
 
     def _add_subtool(self, subtool):
-        if self._parent is not None:
-            self._parent._add_subtool(subtool)
-
-        self.tools[subtool.name] = subtool
+        # Only the root parser is consulted for the MCP tool catalog, so
+        # there is no point in mirroring the registration on every level
+        # of the parser hierarchy.
+        self._root.tools[subtool.name] = subtool
 
     def to_mcp_input_schema(self) -> dict[str, Any]:
-        return {
-            'properties': self.input_schema.properties,
-            'required': self.input_schema.required,
-            'type': 'object',
-        }
+        # The schema is requested repeatedly (tool registration, client
+        # introspection) but changes only via add_argument/add_properties,
+        # so build it once and invalidate on mutation.
+        if self._cached_input_schema is None:
+            self._cached_input_schema = {
+                # Materialize a plain dict - properties may be a ChainMap
+                # over the parent parser and JSON encoders want dicts.
+                'properties': dict(self.input_schema.properties),
+                # Insertions are deduped via _required_set, so a plain
+                # copy keeps the declaration order.
+                'required': list(self.input_schema.required),
+                'type': 'object',
+            }
+
+        return self._cached_input_schema
 
     def add_properties(self, properties: dict[str, dict[str, str]], required: bool = True) -> None:
         """Add extra input properties to the tool schema.
@@ -176,12 +276,22 @@ class ArgParserTool:
         Args:
             properties: Dictionary mapping property names to their JSON schema specs.
                         Each spec should contain at least a 'type' key.
+                        The specs are stored by reference and shared by every
+                        tool they are added to - treat them as immutable.
             required: Whether the properties should be marked as required (default: True).
         """
+        if self._frozen:
+            raise ArgToToolConversionError(self.name + ': cannot add properties to a frozen tool')
+
+        self._cached_input_schema = None
+        self._fast_parse_args = None
+
         for param_name, param_spec in properties.items():
-            self.input_schema.properties[param_name] = param_spec.copy()
-            if required:
+            param_name = sys.intern(param_name)
+            self.input_schema.properties[param_name] = param_spec
+            if required and param_name not in self._required_set:
                 self.input_schema.required.append(param_name)
+                self._required_set.add(param_name)
 
     def _validate_arguments(self, arguments: dict[str, Any]) -> list[str]:
         """Validate that all required parameters are present in arguments.
@@ -194,6 +304,108 @@ class ArgParserTool:
         """
         return [p for p in self.input_schema.required if p not in arguments]
 
+    @property
+    def frozen(self) -> bool:
+        """True once freeze() has sealed the tool schema."""
+
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Seal the tool schema once registration is complete.
+
+        Prebuilds the cached input schema and the compiled parse_args
+        function so the first tool call does not pay for them; any
+        later schema mutation raises ArgToToolConversionError.
+        """
+
+        self._frozen = True
+        self.to_mcp_input_schema()
+        if self._fast_parse_args is None:
+            self._fast_parse_args = self._compile_parse_args()
+
+    def _raise_missing_arguments(self, arguments: dict[str, Any]) -> None:
+        missing_params = self._validate_arguments(arguments)
+        raise MissingArgument(
+            f"Tool '{self.name}' missing required parameters: {', '.join(missing_params)}"
+        )
+
+    def _compile_parse_args(self):
+        """Generate a parse_args function specialized for this tool's schema.
+
+        Once the schema is complete, the property names, defaults and
+        array coercions are all fixed, so the per-call loop over the
+        properties can be unrolled into straight-line code: one
+        presence check for the required parameters and one statement
+        per property.
+        """
+
+        required = set(self.input_schema.required)
+
+        lines = ['def _fast_parse_args(arguments):']
+        if required:
+            # One C-level set comparison instead of a chain of per-name
+            # membership tests; the message is only built on failure.
+            lines.append('    if not _required <= arguments.keys():')
+            lines.append('        _raise_missing(arguments)')
+        lines.append('    prepared = {}')
+
+        # Defaults are passed by reference instead of being inlined as
+        # literals - argparse defaults are arbitrary objects and their
+        # repr is not guaranteed to round-trip through compile().
+        defaults = {}
+
+        for prop_name, prop_spec in self.input_schema.properties.items():
+            key = repr(prop_name)
+            is_array = prop_spec.get('type') == 'array'
+
+            if prop_name in required:
+                if is_array:
+                    lines.append(f'    value = arguments[{key}]')
+                    lines.append(
+                        f'    prepared[{key}] = value if isinstance(value, list) else [value]')
+                else:
+                    lines.append(f'    prepared[{key}] = arguments[{key}]')
+                continue
+
+            if 'default' in prop_spec:
+                defaults[prop_name] = prop_spec['default']
+                fallback = f'_defaults[{key}]'
+            else:
+                # Optional properties without defaults get None
+                # (ArgumentParser behavior)
+                fallback = 'None'
+
+            if is_array:
+                lines.append(f'    if {key} in arguments:')
+                lines.append(f'        value = arguments[{key}]')
+                lines.append(
+                    f'        prepared[{key}] = value if isinstance(value, list) else [value]')
+                lines.append('    else:')
+                lines.append(f'        prepared[{key}] = {fallback}')
+            else:
+                lines.append(f'    prepared[{key}] = arguments.get({key}, {fallback})')
+
+        lines.append('    return SimpleNamespace(**prepared)')
+
+        namespace = {
+            'SimpleNamespace': SimpleNamespace,
+            'isinstance': isinstance,
+            '_defaults': defaults,
+            '_required': frozenset(required),
+            '_raise_missing': self._raise_missing_arguments,
+        }
+        source = '\n'.join(lines)
+        filename = f'<parse_args:{self.name}>'
+
+        # Register the generated source so tracebacks through the
+        # compiled function show real code lines instead of blanks.
+        linecache.cache[filename] = (
+            len(source), None, source.splitlines(keepends=True), filename)
+
+        # pylint: disable-next=exec-used
+        exec(compile(source, filename, 'exec'), namespace)
+        return namespace['_fast_parse_args']
+
     def parse_args(
             self,
             arguments: dict[str, Any],
@@ -206,6 +418,10 @@ class ArgParserTool:
         - Applying defaults for missing parameters that have them
         - Setting None for optional parameters without defaults
 
+        The work is delegated to a function compiled specifically for
+        this tool's schema; the compiled function is cached and rebuilt
+        whenever the schema changes.
+
         Args:
             arguments: Dictionary of provided arguments.
 
@@ -213,27 +429,8 @@ class ArgParserTool:
             SimpleNamespace with prepared arguments.
         """
 
-        # Validate required parameters are present
-        missing_params = self._validate_arguments(arguments)
-        if missing_params:
-            raise MissingArgument(
-                f"Tool '{self.name}' missing required parameters: {', '.join(missing_params)}"
-            )
-
-        prepared = {}
+        fast = self._fast_parse_args
+        if fast is None:
+            fast = self._fast_parse_args = self._compile_parse_args()
 
-        for prop_name, prop_spec in self.input_schema.properties.items():
-            if prop_name in arguments:
-                value = arguments[prop_name]
-                # Ensure array-typed properties are always lists
-                # (MCP clients may pass a single string instead of a list)
-                if prop_spec.get('type') == 'array' and not isinstance(value, list):
-                    value = [value]
-                prepared[prop_name] = value
-            elif 'default' in prop_spec:
-                prepared[prop_name] = prop_spec['default']
-            elif prop_name not in self.input_schema.required:
-                # Optional properties without defaults get None (ArgumentParser behavior)
-                prepared[prop_name] = None
-
-        return SimpleNamespace(**prepared)
+        return fast(arguments)
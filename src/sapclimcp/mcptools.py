@@ -2,22 +2,29 @@
 MCP tool classes and helpers for sapcli commands.
 """
 
+import asyncio
+import atexit
+import contextvars
+import hashlib
+import importlib
+import importlib.metadata
+import json
 import logging
-from io import StringIO
+import operator
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
 from typing import (
     Any,
     Callable,
     ClassVar,
     FrozenSet,
-    Generic,
-    NamedTuple,
     Union,
 )
 from dataclasses import dataclass
-from types import SimpleNamespace
-from typing_extensions import TypeVar
-
-from pydantic import TypeAdapter
+from types import MappingProxyType, SimpleNamespace
 
 from sap import (
     adt,
@@ -37,6 +44,19 @@ from sapclimcp.argparsertool import ArgParserTool
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _jdumps(obj: Any) -> str:
+        """Serialize obj to compact JSON (orjson fast path)."""
+
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _jdumps(obj: Any) -> str:
+        """Serialize obj to compact JSON (stdlib fallback)."""
+
+        return json.dumps(obj, separators=(',', ':'))
+
 # Type aliases for SAP connections and commands
 SAPConnectionType = Union[adt.Connection]
 CommandType = Callable[[SAPConnectionType, SimpleNamespace], None]
@@ -76,14 +96,178 @@ GCTS_CONNECTION_PARAMS: dict[str, dict[str, str]] = {
     'verify': {'type': 'boolean'},
 }
 
+# Names of the HTTP connection parameters (ADT and gCTS share them).
+# Derived from the parameter dictionaries above so the two sources of
+# truth cannot drift apart.
+HTTP_CONNECTION_PARAM_KEYS: FrozenSet[str] = (
+    frozenset(COMMON_CONNECTION_PARAMS) | frozenset(ADT_CONNECTION_PARAMS)
+)
+
+# Mapping from connection factory functions to their specific parameters,
+# frozen at import time so it is built exactly once and cannot be
+# mutated by accident.
+_CONN_FACTORY_PARAMS = MappingProxyType({
+    sap.cli.adt_connection_from_args: ADT_CONNECTION_PARAMS,
+    sap.cli.rfc_connection_from_args: RFC_CONNECTION_PARAMS,
+    sap.cli.gcts_connection_from_args: GCTS_CONNECTION_PARAMS,
+    sap.cli.odata_connection_from_args: ODATA_CONNECTION_PARAMS,
+})
+
+
+# Pool of authenticated connections keyed by connection factory and
+# connection parameters. Re-using a connection lets warm follow-up tool
+# calls skip the TCP+TLS handshake and login round-trip which otherwise
+# dominate per-call latency.
+_CONNECTION_POOL: dict[tuple, tuple['SAPConnectionType', float]] = {}
+_CONNECTION_POOL_LOCK = threading.Lock()
+
+# Drop pooled connections which were not refreshed within this interval
+# so the server does not keep stale sessions forever.
+_CONNECTION_TTL_SECONDS = 300.0
+
+# Order of the argument members forming the pool key. The password is
+# kept out of the plain part and folded in separately as a digest.
+_CONNECTION_KEY_PARAMS = ('ashost', 'port', 'client', 'user', 'ssl', 'verify')
+
+# Fetches all non-secret key members in one C-level call instead of a
+# Python loop of getattr calls.
+_POOL_KEY_GETTER = operator.attrgetter(*_CONNECTION_KEY_PARAMS)
+
+
+def _connection_pool_key(args: SimpleNamespace, conn_factory: Callable) -> tuple:
+    """Build a hashable pool key from the connection parameters in args.
+
+    The password is folded into the key as a short digest so the raw
+    secret is not retained in the pool dictionary.
+
+    Args:
+        args: Namespace holding the connection parameters.
+        conn_factory: The sapcli connection factory being pooled.
+
+    Returns:
+        Tuple identifying the connection type, target system and user.
+    """
+
+    password = getattr(args, 'password', None)
+    if password is not None:
+        password = hashlib.blake2b(str(password).encode(), digest_size=8).hexdigest()
+
+    try:
+        plain = _POOL_KEY_GETTER(args)
+    except AttributeError:
+        # Namespaces built by parse_args always carry all key members;
+        # tolerate hand-crafted ones with missing fields.
+        plain = tuple(getattr(args, name, None) for name in _CONNECTION_KEY_PARAMS)
+
+    return (conn_factory, password) + plain
+
+
+def _get_pooled_connection(
+        args: SimpleNamespace,
+        conn_factory: Callable,
+) -> tuple[tuple, 'SAPConnectionType', bool]:
+    """Return a pooled connection for args, creating one if necessary.
+
+    Args:
+        args: Namespace holding the connection parameters.
+        conn_factory: The sapcli connection factory to use.
+
+    Returns:
+        Tuple of (pool key, connection, True if the connection was reused).
+    """
+
+    key = _connection_pool_key(args, conn_factory)
+    now = time.monotonic()
+
+    with _CONNECTION_POOL_LOCK:
+        entry = _CONNECTION_POOL.get(key)
+        if entry is not None and now - entry[1] < _CONNECTION_TTL_SECONDS:
+            return key, entry[0], True
+
+    conn = conn_factory(args)
+
+    with _CONNECTION_POOL_LOCK:
+        _CONNECTION_POOL[key] = (conn, now)
+
+    return key, conn, False
+
+
+def _evict_pooled_connection(key: tuple) -> None:
+    """Remove the pooled connection for key, if any."""
+
+    with _CONNECTION_POOL_LOCK:
+        _CONNECTION_POOL.pop(key, None)
+
+
+def clear_connection_pool() -> None:
+    """Drop all pooled connections (forces fresh logins on next use)."""
+
+    with _CONNECTION_POOL_LOCK:
+        _CONNECTION_POOL.clear()
+
+
+# Do not keep authenticated sessions around past interpreter shutdown.
+atexit.register(clear_connection_pool)
+
+
+class _ListSink:
+    """Minimal write-only file object collecting chunks in a list.
+
+    Appending to a list and joining once on read is consistently faster
+    than StringIO which re-allocates its backing buffer on every write.
+    """
+
+    __slots__ = ('chunks',)
+
+    def __init__(self):
+        self.chunks: list[str] = []
+
+    def write(self, data: str) -> int:
+        """Append data to the collected chunks."""
+
+        self.chunks.append(data)
+        return len(data)
+
+    def writelines(self, lines) -> None:
+        """Append all lines in one extend call (file API compatibility)."""
+
+        self.chunks.extend(lines)
+
+    def flush(self) -> None:
+        """No-op - the data is already in memory."""
+
+    def getvalue(self) -> str:
+        """Return the collected data as one string (StringIO compatibility)."""
+
+        return "".join(self.chunks)
+
+    def truncate(self, size: int = 0) -> int:
+        """Drop the collected data (StringIO compatibility; only size 0)."""
+
+        if size != 0:
+            raise ValueError('_ListSink supports truncate(0) only')
+
+        self.chunks.clear()
+        return 0
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        """No-op (StringIO compatibility) - writes always append."""
+
+        return 0
+
 
 class OutputBuffer(sap.cli.core.PrintConsole):
     """Capture output of sapcli commands in memory buffer.
     """
 
+    # The base PrintConsole is not slotted, so instances still carry its
+    # __dict__, but the hot capout/caperr accessors go through slot
+    # descriptors instead of a dict lookup.
+    __slots__ = ('std_output', 'err_output')
+
     def __init__(self):
-        self.std_output = StringIO()
-        self.err_output = StringIO()
+        self.std_output = _ListSink()
+        self.err_output = _ListSink()
 
         super().__init__(out_file=self.std_output, err_file=self.err_output)
 
@@ -92,26 +276,40 @@ class OutputBuffer(sap.cli.core.PrintConsole):
         """Captured standard output
         """
 
-        return self.std_output.getvalue()
+        return "".join(self.std_output.chunks)
 
     @property
     def caperr(self) -> str:
         """Captured error output
         """
 
-        return self.err_output.getvalue()
+        return "".join(self.err_output.chunks)
+
+    @property
+    def empty(self) -> bool:
+        """True if nothing has been captured on either sink
+        """
+
+        return not self.std_output.chunks and not self.err_output.chunks
+
+    # Captures with at most this many chunks keep their backing array on
+    # reset; anything bigger is dropped so one huge listing does not pin
+    # its peak memory for the lifetime of the thread-local buffer.
+    RESET_KEEP_CHUNKS = 1024
 
     def reset(self) -> None:
         """Reset captured contents
         """
 
-        self.std_output.truncate(0)
-        self.std_output.seek(0)
-        self.err_output.truncate(0)
-        self.err_output.seek(0)
+        for sink in (self.std_output, self.err_output):
+            if len(sink.chunks) > self.RESET_KEEP_CHUNKS:
+                sink.chunks = []
+            else:
+                sink.chunks.clear()
 
 
-class OperationResult(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class OperationResult:
     """MCP tool results
     """
 
@@ -119,72 +317,226 @@ class OperationResult(NamedTuple):
     LogMessages: list[str]
     Contents: str
 
+    def as_payload(self) -> dict[str, Any]:
+        """Return the structured-content form of the result.
+
+        The single place defining how an OperationResult appears on the
+        wire - used by the per-command tools and the batch tool alike.
+        """
+
+        return {
+            'Success': self.Success,
+            'LogMessages': self.LogMessages,
+            'Contents': self.Contents,
+        }
+
+
+def _connection_failure(label: str, ex: errors.SAPCliError) -> OperationResult:
+    """Build the failure result reported when a connection cannot be made.
+
+    Args:
+        label: Human readable description of the connection target.
+        ex: The error raised by the connection factory.
+
+    Returns:
+        OperationResult describing the connection failure.
+    """
+
+    return OperationResult(
+            Success=False,
+            LogMessages=[label, str(ex)],
+            Contents=""
+        )
+
+
+def _run_pooled_command(
+        args: SimpleNamespace,
+        command: CommandType,
+        conn_factory: Callable,
+        error_label: str,
+) -> OperationResult:
+    """Run command over a pooled connection created by conn_factory.
+
+    An application-level failure (SAPCliError reported by the command)
+    is returned as-is: the server answered, so the connection is fine
+    and re-running the command could duplicate a write operation. Only
+    a transport-level exception evicts the pooled connection - and when
+    it happened on a reused connection, the command is retried once on
+    a fresh login because the most likely cause is a session that went
+    stale in the pool.
+
+    Args:
+        args: Namespace holding connection and command parameters.
+        command: The sapcli command to execute.
+        conn_factory: The sapcli connection factory to pool.
+        error_label: Human readable label for connection failures.
+
+    Returns:
+        OperationResult from the command execution.
+    """
 
-def _run_adt_command(args: SimpleNamespace, command: CommandType):
     try:
-        adt_conn = sap.cli.adt_connection_from_args(args)
+        key, conn, reused = _get_pooled_connection(args, conn_factory)
     except errors.SAPCliError as ex:
-        return OperationResult(
-                Success=False,
-                LogMessages=['Could not connect to ADT Server', str(ex)],
-                Contents=""
-            )
+        return _connection_failure(error_label, ex)
+
+    try:
+        return _run_sapcli_command(command, conn, args)
+    # A transport failure can be raised by any HTTP layer underneath
+    # sapcli, so there is no narrower type to catch here.
+    # pylint: disable-next=broad-except
+    except Exception:
+        _evict_pooled_connection(key)
+        if not reused:
+            raise
+
+    try:
+        key, conn, _ = _get_pooled_connection(args, conn_factory)
+    except errors.SAPCliError as ex:
+        return _connection_failure(error_label, ex)
 
-    return _run_sapcli_command(command, adt_conn, args)
+    try:
+        return _run_sapcli_command(command, conn, args)
+    # pylint: disable-next=broad-except
+    except Exception:
+        _evict_pooled_connection(key)
+        raise
+
+
+def _run_adt_command(args: SimpleNamespace, command: CommandType):
+    return _run_pooled_command(args, command,
+                               sap.cli.adt_connection_from_args,
+                               'Could not connect to ADT Server')
 
 
 def _run_gcts_command(
         args: SimpleNamespace,
         command: CommandType,
 ) -> OperationResult:
-    try:
-        gcts_conn = sap.cli.gcts_connection_from_args(args)
-    except errors.SAPCliError as ex:
-        return OperationResult(
-                Success=False,
-                LogMessages=['Could not connect to ABAP HTTP Server', str(ex)],
-                Contents=""
-            )
+    return _run_pooled_command(args, command,
+                               sap.cli.gcts_connection_from_args,
+                               'Could not connect to ABAP HTTP Server')
+
+
+# sapcli's console is a process-wide global. Route it through a
+# ContextVar instead so each asyncio.to_thread call (which runs in a
+# copy of the calling context) sees its own OutputBuffer and concurrent
+# tool calls no longer serialize on a lock around command execution.
+_CONSOLE_VAR: contextvars.ContextVar = contextvars.ContextVar('sapcli_console')
+
 
-    return _run_sapcli_command(command, gcts_conn, args)
+def _install_contextvar_console() -> None:
+    """Patch sap.cli.core's console accessors to be context-scoped.
+
+    Installed once at import time; the original get_console remains the
+    fallback for contexts which never set a console (e.g. sapcli used
+    directly from a script).
+    """
+
+    original_get_console = sap.cli.core.get_console
+
+    def get_console():
+        console = _CONSOLE_VAR.get(None)
+        return console if console is not None else original_get_console()
+
+    def set_console(console):
+        _CONSOLE_VAR.set(console)
+
+    sap.cli.core.get_console = get_console
+    sap.cli.core.set_console = set_console
+
+
+_install_contextvar_console()
+
+# Worker threads reuse one OutputBuffer each instead of allocating a
+# fresh pair of sinks per command invocation.
+_THREAD_LOCAL = threading.local()
+
+
+def _thread_output_buffer() -> OutputBuffer:
+    """Return this thread's OutputBuffer, reset and ready for capturing."""
+
+    buf = getattr(_THREAD_LOCAL, 'buf', None)
+    if buf is None:
+        buf = OutputBuffer()
+        _THREAD_LOCAL.buf = buf
+
+    buf.reset()
+    return buf
 
 
 def _run_sapcli_command(command: CommandType, conn: SAPConnectionType, args: SimpleNamespace) -> OperationResult:
 
-    output_buffer = OutputBuffer()
+    # The captured output is copied into plain strings before this
+    # function returns, so reusing the buffer on the next call is safe.
+    output_buffer = _thread_output_buffer()
 
+    # Context-scoped via _install_contextvar_console - concurrent calls
+    # in other threads keep their own console.
     sap.cli.core.set_console(output_buffer)
 
     try:
         command(conn, args)
     except errors.SAPCliError as ex:
+        log_messages = [str(ex)]
+        caperr = output_buffer.caperr
+        if caperr:
+            log_messages.append(caperr)
+
         return OperationResult(
                 Success=False,
-                LogMessages=[str(ex), output_buffer.caperr],
+                LogMessages=log_messages,
                 Contents=output_buffer.capout
             )
 
+    # Do not materialize (and ship) empty strings for commands which
+    # print nothing - quite common for write operations.
+    if output_buffer.empty:
+        return OperationResult(Success=True, LogMessages=[], Contents="")
+
+    caperr = output_buffer.caperr
     return OperationResult(
             Success=True,
-            LogMessages=[output_buffer.caperr],
+            LogMessages=[caperr] if caperr else [],
             Contents=output_buffer.capout
         )
 
 
-T = TypeVar("T", default=Any)
-
-
-@dataclass
-class _WrappedResult(Generic[T]):
-    """Generic wrapper for non-object return types."""
-
-    result: T
+# Common output schema of all sapcli tools - the FastMCP wrapping of an
+# OperationResult. Written out by hand: the shape is static and pydantic's
+# TypeAdapter reflection only re-derived this constant at startup.
+_OUTPUT_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'result': {
+            'type': 'object',
+            'properties': {
+                'Success': {'type': 'boolean'},
+                'LogMessages': {'type': 'array', 'items': {'type': 'string'}},
+                'Contents': {'type': 'string'},
+            },
+            'required': ['Success', 'LogMessages', 'Contents'],
+        },
+    },
+    'required': ['result'],
+    'x-fastmcp-wrap-result': True,
+}
 
 
 class SapcliCommandToolError(ToolError):
     """Error raised by SapcliCommandTool."""
 
 
+# Memoized from_argparser_tool conversions, keyed weakly by the source
+# ArgParserTool with the converted tool held weakly as well: an entry
+# lives exactly as long as somebody (normally the FastMCP server) keeps
+# the converted tool alive, so the cache never extends any lifetime.
+# Only frozen tools are cached - their schema cannot change under us.
+_CONVERTED_TOOLS: 'weakref.WeakKeyDictionary[ArgParserTool, weakref.ref]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
 class SapcliCommandTool(Tool):
     """MCP Tool for executing sapcli commands.
 
@@ -198,11 +550,13 @@ class SapcliCommandTool(Tool):
 
     arg_tool: ArgParserTool
 
+    # Runner resolved from the connection factory once at registration;
+    # from_argparser_tool refuses to build a tool without one, so the
+    # field is required and never None on a constructed tool.
+    runner: Callable[['SapcliCommandTool', SimpleNamespace], OperationResult]
+
     # HTTP connection parameter names used by ADT and gCTS
-    HTTP_CONNECTION_PARAMS: ClassVar[FrozenSet[str]] = frozenset({
-        'ashost', 'port', 'client', 'user', 'password',
-        'ssl', 'verify'
-    })
+    HTTP_CONNECTION_PARAMS: ClassVar[FrozenSet[str]] = HTTP_CONNECTION_PARAM_KEYS
 
     def _run_adt(
             self,
@@ -244,37 +598,25 @@ class SapcliCommandTool(Tool):
             ToolResult with the command output.
 
         Raises:
-            SapcliCommandToolError: If cmdfn is None, required parameters are missing,
-                or connection type is not supported.
+            SapcliCommandToolError: If required parameters are missing.
         """
-        if self.arg_tool.cmdfn is None:
-            raise SapcliCommandToolError(
-                f"Tool '{self.name}' has no command function (cmdfn is None)"
-            )
-
+        # from_argparser_tool guarantees cmdfn and runner, so the per
+        # request path is parse, execute, wrap.
         try:
             cmd_args = self.arg_tool.parse_args(arguments)
         except argparsertool.MissingArgument as ex:
             raise SapcliCommandToolError(str(ex))
 
-        # pylint: disable-next=comparison-with-callable
-        if self.arg_tool.conn_factory == sap.cli.adt_connection_from_args:
-            result = self._run_adt(cmd_args)
-        # pylint: disable-next=comparison-with-callable
-        elif self.arg_tool.conn_factory == sap.cli.gcts_connection_from_args:
-            result = self._run_gcts(cmd_args)
-        else:
-            raise SapcliCommandToolError(
-                f"Tool '{self.name}' uses unsupported connection type. "
-                "Only ADT and gCTS connections are currently supported."
-            )
+        # The sapcli commands perform synchronous network I/O; run them in
+        # a worker thread so the FastMCP event loop can serve other tool
+        # calls in the meantime.
+        result = await asyncio.to_thread(self.runner, self, cmd_args)
 
-        # OperationResult is a NamedTuple which serializes as an array [bool, list[str], str]
+        # Empty output (common for write operations) becomes no content
+        # block at all instead of an empty text block.
         return ToolResult(
-            content=result.Contents,
-            structured_content={
-                'result': [result.Success, result.LogMessages, result.Contents]
-            }
+            content=result.Contents or None,
+            structured_content={'result': result.as_payload()}
         )
 
     @classmethod
@@ -293,37 +635,374 @@ class SapcliCommandTool(Tool):
             A new SapcliCommandTool instance.
 
         Raises:
-            SapcliCommandToolError: If cmd.cmdfn is None.
+            SapcliCommandToolError: If the command has no command
+                function or its connection type is not supported -
+                better a registration failure than a tool that errors
+                on its first invocation.
         """
-        output_schema = TypeAdapter(_WrappedResult[OperationResult]).json_schema(mode='serialization')
-        output_schema["x-fastmcp-wrap-result"] = True
+        if description is None and cmd.frozen:
+            cached_ref = _CONVERTED_TOOLS.get(cmd)
+            cached = cached_ref() if cached_ref is not None else None
+            if cached is not None:
+                return cached
 
-        return cls(
+        if cmd.cmdfn is None:
+            raise SapcliCommandToolError(
+                f"Tool '{cmd.name}' has no command function (cmdfn is None)"
+            )
+
+        runner = _runner_for_factory(cmd.conn_factory)
+        if runner is None:
+            raise SapcliCommandToolError(
+                f"Tool '{cmd.name}' uses unsupported connection type. "
+                "Only ADT and gCTS connections are currently supported."
+            )
+
+        tool = cls(
             name=cmd.name,
             description=description or f"Execute sapcli command: {cmd.name}",
             parameters=cmd.to_mcp_input_schema(),
-            output_schema=output_schema,
+            # All tools share the one schema constant - FastMCP only reads
+            # it, so a per-tool copy would be pure allocation overhead.
+            output_schema=_OUTPUT_SCHEMA,
             arg_tool=cmd,
+            runner=runner,
+        )
+
+        if description is None and cmd.frozen:
+            _CONVERTED_TOOLS[cmd] = weakref.ref(tool)
+
+        return tool
+
+
+# Input schema of the batch meta-tool - hand written because it does not
+# correspond to any sapcli command.
+_BATCH_INPUT_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'calls': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'tool': {'type': 'string'},
+                    'arguments': {'type': 'object'},
+                },
+                'required': ['tool'],
+            },
+        },
+        'stop_on_error': {'type': 'boolean', 'default': True},
+    },
+    'required': ['calls'],
+}
+
+_BATCH_OUTPUT_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'result': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'tool': {'type': 'string'},
+                    'Success': {'type': 'boolean'},
+                    'LogMessages': {'type': 'array', 'items': {'type': 'string'}},
+                    'Contents': {'type': 'string'},
+                },
+            },
+        },
+    },
+    'required': ['result'],
+    'x-fastmcp-wrap-result': True,
+}
+
+
+class BatchExecuteTool(Tool):
+    """MCP meta tool executing several sapcli tool calls in one request.
+
+    Consecutive calls with the same connection parameters reuse one
+    pooled connection, so the handshake and login cost is paid once per
+    batch instead of once per call.
+    """
+
+    model_config = {'arbitrary_types_allowed': True}
+
+    # Registered sapcli tools available for dispatch, keyed by tool name.
+    sapcli_tools: dict[str, SapcliCommandTool]
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        """Run the requested tool calls in order.
+
+        Args:
+            arguments: Dictionary with 'calls' - a list of
+                {'tool': name, 'arguments': {...}} items - and an
+                optional 'stop_on_error' flag (default True).
+
+        Returns:
+            ToolResult with one entry per executed call.
+
+        Raises:
+            SapcliCommandToolError: If calls is missing or not a list.
+        """
+
+        calls = arguments.get('calls')
+        if not isinstance(calls, list):
+            raise SapcliCommandToolError(
+                f"Tool '{self.name}' requires the parameter calls as a list"
+            )
+
+        stop_on_error = arguments.get('stop_on_error', True)
+
+        results = []
+        for call in calls:
+            tool_name = call.get('tool') if isinstance(call, dict) else None
+            tool = self.sapcli_tools.get(tool_name) if isinstance(tool_name, str) else None
+            if tool is None:
+                result = OperationResult(
+                    Success=False,
+                    LogMessages=[f"Unknown tool: {tool_name}"],
+                    Contents="",
+                )
+            else:
+                result = await self._run_single(tool, call.get('arguments') or {})
+
+            results.append({'tool': tool_name, **result.as_payload()})
+
+            if stop_on_error and not result.Success:
+                break
+
+        return ToolResult(content=None, structured_content={'result': results})
+
+    @staticmethod
+    async def _run_single(tool: SapcliCommandTool, call_arguments: dict) -> OperationResult:
+        """Execute one sub-call, mapping dispatch errors to failed results.
+
+        Unlike a direct tool call, a broken sub-call must not abort the
+        whole batch with an exception - the caller gets a per-call
+        failure entry instead. That covers transport failures re-raised
+        by the pooled runner as well as missing arguments.
+        """
+
+        try:
+            cmd_args = tool.arg_tool.parse_args(call_arguments)
+        except argparsertool.MissingArgument as ex:
+            return OperationResult(Success=False, LogMessages=[str(ex)], Contents="")
+
+        try:
+            return await asyncio.to_thread(tool.runner, tool, cmd_args)
+        # The runner propagates transport-level exceptions of any type
+        # (see _run_pooled_command); with stop_on_error the failure
+        # entry still ends the batch, but with the results so far.
+        # pylint: disable-next=broad-except
+        except Exception as ex:
+            return OperationResult(Success=False, LogMessages=[str(ex)], Contents="")
+
+    @classmethod
+    def from_sapcli_tools(cls, tools: dict[str, SapcliCommandTool]) -> 'BatchExecuteTool':
+        """Create the batch meta tool over the registered sapcli tools."""
+
+        return cls(
+            name='abap_batch_execute',
+            description=(
+                'Execute several sapcli tools in one request. Each call names '
+                'a registered tool and its arguments; calls sharing connection '
+                'parameters reuse one pooled connection.'
+            ),
+            parameters=_BATCH_INPUT_SCHEMA,
+            output_schema=_BATCH_OUTPUT_SCHEMA,
+            sapcli_tools=tools,
         )
 
 
+# Version of the on-disk tool catalog cache format; bump when the cached
+# structure changes.
+_TOOL_CACHE_VERSION = 1
+
+
+def _tool_cache_path() -> Path:
+    """Return the path of the on-disk tool catalog cache."""
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(cache_home) / 'sapclimcp' / 'tools.json'
+
+
+def _sap_cli_fingerprint() -> str:
+    """Fingerprint the installed sap.cli sources.
+
+    A development install can change without a version bump; the file
+    count plus the newest mtime catches edited, added and removed
+    modules without hashing any file contents.
+    """
+
+    try:
+        sources = list(Path(sap.cli.__file__).parent.glob('*.py'))
+        newest = max((src.stat().st_mtime_ns for src in sources), default=0)
+    except OSError:
+        return 'unknown'
+
+    return f'{len(sources)}:{newest}'
+
+
+def _tool_cache_key(allowed_commands: list[str] | None) -> str:
+    """Compute the cache key identifying the current tool catalog.
+
+    The key covers the installed sapcli version, its source
+    fingerprint, the available command names and the requested
+    allowlist, so any of them changing invalidates the cache.
+    """
+
+    try:
+        sapcli_version = importlib.metadata.version('sapcli')
+    except importlib.metadata.PackageNotFoundError:
+        sapcli_version = 'unknown'
+
+    command_names = sorted(cmd.name for _, cmd in sap.cli.get_commands())
+    allowed = sorted(allowed_commands) if allowed_commands is not None else None
+
+    payload = repr((_TOOL_CACHE_VERSION, sapcli_version, _sap_cli_fingerprint(),
+                    command_names, allowed))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _callable_ref(func: Callable) -> str:
+    """Serialize a module-level callable into an importable reference."""
+
+    return func.__module__ + ':' + func.__qualname__
+
+
+def _resolve_callable_ref(ref: str) -> Callable:
+    """Resolve a reference created by _callable_ref back to the callable.
+
+    Raises:
+        ImportError, AttributeError: If the reference cannot be resolved.
+    """
+
+    module_name, _, qualname = ref.partition(':')
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+def _load_cached_tools(key: str) -> list[dict] | None:
+    """Load the cached tool catalog if it matches key."""
+
+    try:
+        with open(_tool_cache_path(), encoding='utf-8') as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    if data.get('key') != key:
+        return None
+
+    tools = data.get('tools')
+    return tools if isinstance(tools, list) else None
+
+
+def _store_cached_tools(key: str, tools: list[dict]) -> None:
+    """Write the tool catalog cache; failures are logged, not raised."""
+
+    path = _tool_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as cache_file:
+            json.dump({'key': key, 'tools': tools}, cache_file)
+    # The entries are pre-validated by _cacheable_schema, but an
+    # unserializable value slipping through must cost the cache, not
+    # the server start. A partially written file is rejected on load
+    # by the json.load ValueError handler.
+    except (OSError, TypeError, ValueError) as ex:
+        _LOGGER.debug("Could not store tool catalog cache: %s", ex)
+
+
+def _cacheable_schema(schema: dict) -> bool:
+    """True if schema survives a JSON round-trip unchanged.
+
+    Argparse defaults are arbitrary Python objects. One that json
+    cannot encode would crash the cache write, and one that json
+    mangles (a tuple coming back as a list) would make a warm start
+    advertise a different schema than a cold start - either way the
+    tool must not be cached.
+    """
+
+    try:
+        return json.loads(_jdumps(schema)) == schema
+    except (TypeError, ValueError):
+        return False
+
+
+def _argparser_tool_from_cache(entry: dict) -> ArgParserTool:
+    """Re-hydrate an ArgParserTool from a tool catalog cache entry."""
+
+    tool = ArgParserTool(entry['name'], None,
+                         conn_factory=_resolve_callable_ref(entry['conn_factory']))
+    tool.input_schema.properties.update(entry['input_schema']['properties'])
+    tool.input_schema.required.extend(entry['input_schema']['required'])
+    tool.cmdfn = _resolve_callable_ref(entry['cmdfn'])
+    return tool
+
+
+def _register_cached_tools(server: FastMCP, entries: list[dict]) -> bool:
+    """Register tools from cache entries; False if any entry is stale."""
+
+    try:
+        tools = [SapcliCommandTool.from_argparser_tool(_argparser_tool_from_cache(entry))
+                 for entry in entries]
+    except (KeyError, ImportError, AttributeError) as ex:
+        _LOGGER.debug("Stale tool catalog cache: %s", ex)
+        return False
+
+    for tool in tools:
+        server.add_tool(tool)
+
+    server.add_tool(BatchExecuteTool.from_sapcli_tools({tool.name: tool for tool in tools}))
+
+    return True
+
+
+# Dispatch table resolving a connection factory to the matching runner.
+# Keyed by the sap.cli attribute name and resolved against the live
+# module at registration time, so tests patching the factory functions
+# still match; new connection types only need a new entry here.
+# pylint: disable=protected-access
+_COMMAND_RUNNERS: dict[str, Callable[[SapcliCommandTool, SimpleNamespace], OperationResult]] = {
+    'adt_connection_from_args': SapcliCommandTool._run_adt,
+    'gcts_connection_from_args': SapcliCommandTool._run_gcts,
+}
+# pylint: enable=protected-access
+
+
+def _runner_for_factory(
+        conn_factory: Callable | None
+) -> Union[Callable[[SapcliCommandTool, SimpleNamespace], OperationResult], None]:
+    """Resolve the runner matching a connection factory; None if unsupported."""
+
+    for attr, runner in _COMMAND_RUNNERS.items():
+        if conn_factory is getattr(sap.cli, attr, None):
+            return runner
+
+    return None
+
+
 def transform_sapcli_commands(server: FastMCP, allowed_commands: list[str] | None = None):
     """Transform sapcli commands into MCP tools and register them with the server.
 
     Args:
         server: The FastMCP server instance to register tools with.
     """
+    # Warm starts re-hydrate the tool catalog from the on-disk cache and
+    # skip the argparse walk entirely.
+    cache_key = _tool_cache_key(allowed_commands)
+    cached_entries = _load_cached_tools(cache_key)
+    if cached_entries is not None and _register_cached_tools(server, cached_entries):
+        _LOGGER.debug("Registered %d tools from the catalog cache", len(cached_entries))
+        return
+
     args_tools = ArgParserTool("abap", None)
     args_tools.add_properties(COMMON_CONNECTION_PARAMS)
 
-    # Mapping from connection factory functions to their specific parameters
-    conn_factory_to_params = {
-        sap.cli.adt_connection_from_args: ADT_CONNECTION_PARAMS,
-        sap.cli.rfc_connection_from_args: RFC_CONNECTION_PARAMS,
-        sap.cli.gcts_connection_from_args: GCTS_CONNECTION_PARAMS,
-        sap.cli.odata_connection_from_args: ODATA_CONNECTION_PARAMS,
-    }
-
     # Install ArgParser and build Tools definitions
     # The list items returned by sap.cli.get_commands() are tuples
     # where:
@@ -335,12 +1014,22 @@ def transform_sapcli_commands(server: FastMCP, allowed_commands: list[str] | Non
     # - GCTS - sap.cli.gcts_connection_from_args
     # - OData - sap.cli.odata_connection_from_args
     for conn_factory, cmd in sap.cli.get_commands():
+        # Filter up front: installing the parser walks the command's whole
+        # argparse tree, which is wasted work for command groups that
+        # cannot contribute a single allowed tool.
+        tool_prefix = args_tools.name + "_" + cmd.name
+        if allowed_commands is not None and not any(
+                name == tool_prefix or name.startswith(tool_prefix + "_")
+                for name in allowed_commands):
+            _LOGGER.debug("Skipped command group without allowed tools: %s", cmd.name)
+            continue
+
         cmd_tool = args_tools.add_parser(cmd.name)
 
         # Set connection factory before install_parser so sub-parsers inherit it
         cmd_tool.conn_factory = conn_factory
 
-        specific_params = conn_factory_to_params.get(conn_factory)
+        specific_params = _CONN_FACTORY_PARAMS.get(conn_factory)
         if specific_params is not None:
             cmd_tool.add_properties(specific_params)
 
@@ -350,6 +1039,9 @@ def transform_sapcli_commands(server: FastMCP, allowed_commands: list[str] | Non
     # pylint: disable-next=fixme
     # TODO: add name transformations such as "abap_gcts_delete" to "abap_gcts_repo_delete"
 
+    cache_entries: list[dict] | None = []
+    registered_tools: dict[str, SapcliCommandTool] = {}
+
     for tool_name, cmd_tool in args_tools.tools.items():
         # Skip tools without a command function (not meaningful commands)
         if cmd_tool.cmdfn is None:
@@ -360,4 +1052,41 @@ def transform_sapcli_commands(server: FastMCP, allowed_commands: list[str] | Non
             _LOGGER.debug("Ignored tool: %s", tool_name)
             continue
 
-        server.add_tool(SapcliCommandTool.from_argparser_tool(cmd_tool))
+        # The _jdumps argument is evaluated before the logging call, so
+        # the explicit level check is what actually keeps the JSON
+        # encoding off the production registration path.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Registering tool %s with schema %s",
+                          tool_name, _jdumps(cmd_tool.to_mcp_input_schema()))
+        # Seal the schema and prebuild its caches before the tool goes live.
+        cmd_tool.freeze()
+        try:
+            mcp_tool = SapcliCommandTool.from_argparser_tool(cmd_tool)
+        except SapcliCommandToolError as ex:
+            _LOGGER.warning("Skipped tool %s: %s", tool_name, ex)
+            continue
+        server.add_tool(mcp_tool)
+        registered_tools[tool_name] = mcp_tool
+
+        if cache_entries is not None:
+            cmdfn_ref = _callable_ref(cmd_tool.cmdfn)
+            factory_ref = _callable_ref(cmd_tool.conn_factory) if cmd_tool.conn_factory else None
+            input_schema = cmd_tool.to_mcp_input_schema()
+            if (factory_ref is None or '<' in cmdfn_ref or '<' in factory_ref
+                    or not _cacheable_schema(input_schema)):
+                # Not an importable module-level callable, or a schema
+                # that does not survive JSON - do not cache a catalog we
+                # could not re-hydrate faithfully.
+                cache_entries = None
+            else:
+                cache_entries.append({
+                    'name': tool_name,
+                    'input_schema': input_schema,
+                    'cmdfn': cmdfn_ref,
+                    'conn_factory': factory_ref,
+                })
+
+    server.add_tool(BatchExecuteTool.from_sapcli_tools(registered_tools))
+
+    if cache_entries is not None:
+        _store_cached_tools(cache_key, cache_entries)
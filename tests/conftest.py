@@ -0,0 +1,29 @@
+"""Shared fixtures for the sapclimcp test suite."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_SERVER_SOURCE = Path(__file__).parent.parent / 'src' / 'sapcli-mcp-server.py'
+
+
+@pytest.fixture(scope='session')
+def server():
+    """The sapcli-mcp-server module, loaded once per test session.
+
+    The hyphen in the file name keeps the module off the regular import
+    path, so it is loaded through importlib and cached in sys.modules -
+    repeated test runs within one session do not re-parse and
+    re-execute the source.
+    """
+    module = sys.modules.get('sapcli_mcp_server')
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location('sapcli_mcp_server', _SERVER_SOURCE)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['sapcli_mcp_server'] = module
+    spec.loader.exec_module(module)
+    return module
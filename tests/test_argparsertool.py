@@ -5,6 +5,7 @@ import pytest
 from sapclimcp.argparsertool import (
     ArgParserTool,
     ArgToToolConversionError,
+    MissingArgument,
 )
 
 
@@ -356,6 +357,40 @@ class TestArgParserToolInheritance:
         assert child.name == "parent_child"
 
 
+class TestArgParserToolSchemaCache:
+    """Tests for caching of to_mcp_input_schema."""
+
+    def test_schema_is_cached(self):
+        """Test repeated calls return the same schema object."""
+        tool = ArgParserTool("test", None)
+        tool.add_argument("--name")
+
+        assert tool.to_mcp_input_schema() is tool.to_mcp_input_schema()
+
+    def test_cache_invalidated_by_add_argument(self):
+        """Test add_argument invalidates the cached schema."""
+        tool = ArgParserTool("test", None)
+        tool.add_argument("--name")
+        first = tool.to_mcp_input_schema()
+
+        tool.add_argument("--other")
+        second = tool.to_mcp_input_schema()
+
+        assert first is not second
+        assert "other" in second["properties"]
+
+    def test_cache_invalidated_by_add_properties(self):
+        """Test add_properties invalidates the cached schema."""
+        tool = ArgParserTool("test", None)
+        first = tool.to_mcp_input_schema()
+
+        tool.add_properties({"host": {"type": "string"}})
+        second = tool.to_mcp_input_schema()
+
+        assert first is not second
+        assert "host" in second["properties"]
+
+
 class TestArgParserToolSetDefaults:
     """Tests for set_defaults method."""
 
@@ -444,3 +479,76 @@ class TestArgParserToolParseArgsArrayCoercion:
         result = tool.parse_args({"name": "ZPROG"})
 
         assert result.name == "ZPROG"
+
+class TestArgParserToolCompiledParseArgs:
+    """Tests for the per-tool compiled parse_args function."""
+
+    def test_compiled_parser_is_cached(self):
+        """Test repeated parse_args calls reuse the same compiled function."""
+        tool = ArgParserTool("test", None)
+        tool.add_argument("--name")
+
+        tool.parse_args({"name": "first"})
+        compiled = tool._fast_parse_args
+        tool.parse_args({"name": "second"})
+
+        assert tool._fast_parse_args is compiled
+
+    def test_compiled_parser_rebuilt_after_add_argument(self):
+        """Test add_argument invalidates the compiled parser."""
+        tool = ArgParserTool("test", None)
+        tool.add_argument("--name")
+        tool.parse_args({"name": "ZPROG"})
+
+        tool.add_argument("--corrnr", default="")
+        result = tool.parse_args({"name": "ZPROG"})
+
+        assert result.corrnr == ""
+
+    def test_missing_required_parameter_raises(self):
+        """Test the compiled parser still reports missing required parameters."""
+        tool = ArgParserTool("test", None)
+        tool.add_argument("name")
+        tool.add_argument("--corrnr", default="")
+
+        with pytest.raises(MissingArgument) as caught:
+            tool.parse_args({"corrnr": "C123"})
+
+        assert "name" in str(caught.value)
+
+class TestArgParserToolFreeze:
+    """Tests for freezing the tool schema after registration."""
+
+    def test_frozen_tool_rejects_add_argument(self):
+        """Test add_argument raises on a frozen tool."""
+        tool = ArgParserTool("test", None)
+        tool.add_argument("--name")
+        tool.freeze()
+
+        with pytest.raises(ArgToToolConversionError):
+            tool.add_argument("--other")
+
+    def test_frozen_tool_rejects_add_properties(self):
+        """Test add_properties raises on a frozen tool."""
+        tool = ArgParserTool("test", None)
+        tool.freeze()
+
+        with pytest.raises(ArgToToolConversionError):
+            tool.add_properties({"host": {"type": "string"}})
+
+    def test_frozen_property(self):
+        """Test the frozen property reflects freeze()."""
+        tool = ArgParserTool("test", None)
+        assert not tool.frozen
+        tool.freeze()
+        assert tool.frozen
+
+    def test_freeze_prebuilds_caches(self):
+        """Test freeze builds the schema and the compiled parser eagerly."""
+        tool = ArgParserTool("test", None)
+        tool.add_argument("--name")
+        tool.freeze()
+
+        assert tool._cached_input_schema is not None
+        assert tool._fast_parse_args is not None
+        assert tool.parse_args({"name": "ZPROG"}).name == "ZPROG"
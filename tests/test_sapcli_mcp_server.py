@@ -1,8 +1,9 @@
 """Unit tests for sapcli-mcp-server.py"""
 
+import sys
+
 from unittest.mock import MagicMock, patch
 from types import SimpleNamespace
-from io import StringIO
 
 from sap.errors import SAPCliError
 import sap.cli.core
@@ -14,9 +15,31 @@ from sapclimcp import mcptools
 from sapclimcp.argparsertool import ArgParserTool
 
 
+@pytest.fixture(autouse=True)
+def clean_connection_pool():
+    """Make sure pooled connections do not leak between tests."""
+    mcptools.clear_connection_pool()
+    yield
+    mcptools.clear_connection_pool()
+
+
+@pytest.fixture(scope='module')
+def _adt_connection_patch():
+    """Patch sap.adt.Connection once for the whole module."""
+    with patch('sap.adt.Connection') as mock_connection:
+        yield mock_connection
+
+
 @pytest.fixture
+def adt_connection(_adt_connection_patch):
+    """A fresh sap.adt.Connection mock, reset between tests."""
+    yield _adt_connection_patch
+    _adt_connection_patch.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope='session')
 def sample_adt_config():
-    """Sample ADT connection configuration."""
+    """Sample ADT connection configuration (shared; never mutated)."""
     return {
         'ashost': 'test.sap.example.com',
         'port': 44300,
@@ -28,40 +51,86 @@ def sample_adt_config():
     }
 
 
+def _noop_cmd(conn, args):
+    """Command stub doing nothing."""
+
+
+def _echo_cmd(conn, args):
+    """Command stub printing one line to each console stream."""
+    console = sap.cli.core.get_console()
+    console.printout("test capture stdout")
+    console.printerr("test capture stderr")
+
+
+def _raising_cmd(conn, args):
+    """Command stub printing like _echo_cmd and then failing."""
+    _echo_cmd(conn, args)
+    raise SAPCliError("Command failed")
+
+
+@pytest.fixture(scope='session')
+def adt_args(sample_adt_config):
+    """Parsed-arguments namespace for sample_adt_config.
+
+    Built once per session - the commands under test only read the
+    connection attributes, so sharing one namespace is safe.
+    """
+    return SimpleNamespace(**sample_adt_config)
+
+
+@pytest.fixture(scope='module')
+def _shared_buf():
+    """One OutputBuffer instance reused by all buffer tests."""
+    return mcptools.OutputBuffer()
+
+
+@pytest.fixture
+def buf(_shared_buf):
+    """The shared OutputBuffer, reset before each test."""
+    _shared_buf.reset()
+    return _shared_buf
+
+
 class TestOutputBuffer:
     """Tests for OutputBuffer class."""
 
     def test_init(self):
         """Test OutputBuffer initialization."""
         buf = mcptools.OutputBuffer()
-        assert isinstance(buf.std_output, StringIO)
-        assert isinstance(buf.err_output, StringIO)
+        assert isinstance(buf.std_output, mcptools._ListSink)
+        assert isinstance(buf.err_output, mcptools._ListSink)
 
-    def test_capout_empty(self):
+    def test_capout_joins_chunks(self, buf):
+        """Test capout property joins multiple writes."""
+        buf.std_output.write("first ")
+        buf.std_output.write("second")
+        assert buf.capout == "first second"
+
+    def test_capout_empty(self, buf):
         """Test capout property with empty buffer."""
-        buf = mcptools.OutputBuffer()
         assert buf.capout == ""
 
-    def test_capout_with_content(self):
+    def test_capout_with_content(self, buf):
         """Test capout property with content."""
-        buf = mcptools.OutputBuffer()
         buf.std_output.write("test output")
         assert buf.capout == "test output"
 
-    def test_caperr_empty(self):
+    def test_caperr_empty(self, buf):
         """Test caperr property with empty buffer."""
-        buf = mcptools.OutputBuffer()
         assert buf.caperr == ""
 
-    def test_caperr_with_content(self):
+    def test_caperr_with_content(self, buf):
         """Test caperr property with content."""
-        buf = mcptools.OutputBuffer()
         buf.err_output.write("test error")
         assert buf.caperr == "test error"
 
-    def test_reset(self):
+    def test_writelines_appends_all_chunks(self, buf):
+        """Test writelines lands all chunks in one go."""
+        buf.std_output.writelines(["one ", "two ", "three"])
+        assert buf.capout == "one two three"
+
+    def test_reset(self, buf):
         """Test reset method clears buffers."""
-        buf = mcptools.OutputBuffer()
         buf.std_output.write("output content")
         buf.err_output.write("error content")
         buf.reset()
@@ -70,108 +139,198 @@ class TestOutputBuffer:
 
 
 class TestOperationResult:
-    """Tests for OperationResult NamedTuple."""
-
-    def test_creation(self):
-        """Test OperationResult creation."""
-        result = mcptools.OperationResult(
-            Success=True,
-            LogMessages=["msg1", "msg2"],
-            Contents="content"
-        )
-        assert result.Success is True
-        assert result.LogMessages == ["msg1", "msg2"]
-        assert result.Contents == "content"
-
-    def test_creation_failure(self):
-        """Test OperationResult for failure case."""
-        result = mcptools.OperationResult(
-            Success=False,
-            LogMessages=["error occurred"],
-            Contents=""
-        )
-        assert result.Success is False
-        assert result.LogMessages == ["error occurred"]
-        assert result.Contents == ""
+    """Tests for the OperationResult dataclass."""
+
+    @pytest.mark.parametrize('kwargs', [
+        {'Success': True, 'LogMessages': ["msg1", "msg2"], 'Contents': "content"},
+        {'Success': False, 'LogMessages': ["error occurred"], 'Contents': ""},
+    ])
+    def test_roundtrip(self, kwargs):
+        """Test that construction and as_payload round-trip the fields."""
+        result = mcptools.OperationResult(**kwargs)
+        assert result.Success is kwargs['Success']
+        assert result.as_payload() == kwargs
 
 
 class TestRunAdtCommand:
     """Tests for _run_adt_command function."""
 
-    @patch('sap.adt.Connection')
-    def test_success(self, mock_connection, sample_adt_config):
+    def test_success(self, adt_connection, adt_args):
         """Test successful ADT command execution."""
-        def mock_command(conn, args):
-            console = sap.cli.core.get_console()
-            console.printout("test capture stdout")
-            console.printerr("test capture stderr")
-            pass
-
-        config = SimpleNamespace(**sample_adt_config)
-
-        result = mcptools._run_adt_command(config, mock_command)
+        result = mcptools._run_adt_command(adt_args, _echo_cmd)
 
         assert result.Success is True
         assert result.Contents == "test capture stdout\n"
         assert result.LogMessages == ["test capture stderr\n"]
 
-    @patch('sap.adt.Connection')
-    def test_connection_error(self, mock_connection, sample_adt_config):
+    def test_connection_error(self, adt_connection, adt_args):
         """Test ADT command with connection error."""
-        mock_connection.side_effect = SAPCliError("Connection failed")
-
-        config = SimpleNamespace(**sample_adt_config)
-
-        def mock_command(conn, args):
-            pass
+        adt_connection.side_effect = SAPCliError("Connection failed")
 
-        result = mcptools._run_adt_command(config, mock_command)
+        result = mcptools._run_adt_command(adt_args, _noop_cmd)
         assert result.Success is False
         assert ['Could not connect to ADT Server', 'Connection failed'] == result.LogMessages
         assert result.Contents == ""
 
 
+class TestConnectionPool:
+    """Tests for the ADT connection pool."""
+
+    @patch('sap.cli.adt_connection_from_args')
+    def test_connection_reused(self, mock_conn_factory, adt_args):
+        """Test that a second call with the same config reuses the connection."""
+        mock_conn_factory.return_value = MagicMock()
+
+        mcptools._run_adt_command(adt_args, _noop_cmd)
+        mcptools._run_adt_command(adt_args, _noop_cmd)
+
+        mock_conn_factory.assert_called_once()
+
+    @patch('sap.cli.adt_connection_from_args')
+    def test_command_error_keeps_connection(self, mock_conn_factory, adt_args):
+        """Test that an application error neither evicts nor re-runs."""
+        mock_conn_factory.return_value = MagicMock()
+
+        calls = []
+
+        def failing_command(conn, args):
+            calls.append(conn)
+            raise SAPCliError("Command failed")
+
+        result = mcptools._run_adt_command(adt_args, failing_command)
+        mcptools._run_adt_command(adt_args, _noop_cmd)
+
+        assert result.Success is False
+        assert len(calls) == 1
+        mock_conn_factory.assert_called_once()
+
+    @patch('sap.cli.adt_connection_from_args')
+    def test_transport_failure_evicts_connection(self, mock_conn_factory, adt_args):
+        """Test that a transport failure drops the pooled connection."""
+        mock_conn_factory.return_value = MagicMock()
+
+        def broken_command(conn, args):
+            raise ConnectionResetError("Connection reset")
+
+        with pytest.raises(ConnectionResetError):
+            mcptools._run_adt_command(adt_args, broken_command)
+
+        mcptools._run_adt_command(adt_args, _noop_cmd)
+
+        assert mock_conn_factory.call_count == 2
+
+    @patch('sap.cli.gcts_connection_from_args')
+    def test_gcts_connection_reused(self, mock_conn_factory, adt_args):
+        """Test that gCTS commands reuse pooled connections too."""
+        mock_conn_factory.return_value = MagicMock()
+
+        mcptools._run_gcts_command(adt_args, _noop_cmd)
+        mcptools._run_gcts_command(adt_args, _noop_cmd)
+
+        mock_conn_factory.assert_called_once()
+
+    @patch('sap.cli.adt_connection_from_args')
+    def test_retry_on_reused_connection(self, mock_conn_factory, adt_args):
+        """Test that a transport failure on a reused connection retries once."""
+        mock_conn_factory.return_value = MagicMock()
+
+        calls = []
+
+        def mock_command(conn, args):
+            calls.append(conn)
+            if len(calls) == 2:
+                raise ConnectionResetError("Connection reset")
+
+        # First call populates the pool, second one fails on the reused
+        # connection and must be retried on a fresh one.
+        mcptools._run_adt_command(adt_args, mock_command)
+        result = mcptools._run_adt_command(adt_args, mock_command)
+
+        assert result.Success is True
+        assert len(calls) == 3
+
+
 class TestRunSapcliCommand:
     """Tests for _run_sapcli_command function."""
 
     def test_success(self):
         """Test successful sapcli command execution."""
-        mock_conn = MagicMock()
-
-        def mock_command(conn, args):
-            console = sap.cli.core.get_console()
-            console.printout("test capture stdout")
-            console.printerr("test capture stderr")
+        # _run_sapcli_command only forwards the connection - a bare
+        # sentinel is enough and avoids MagicMock's attribute machinery.
+        mock_conn = object()
 
-        result = mcptools._run_sapcli_command(mock_command, mock_conn, SimpleNamespace())
+        result = mcptools._run_sapcli_command(_echo_cmd, mock_conn, SimpleNamespace())
 
         assert result.Success is True
         assert result.Contents == "test capture stdout\n"
         assert result.LogMessages == ["test capture stderr\n"]
 
+    def test_success_without_output(self):
+        """Test that a silent command produces no log messages."""
+        # _run_sapcli_command only forwards the connection - a bare
+        # sentinel is enough and avoids MagicMock's attribute machinery.
+        mock_conn = object()
+
+        result = mcptools._run_sapcli_command(_noop_cmd, mock_conn, SimpleNamespace())
+
+        assert result.Success is True
+        assert result.Contents == ""
+        assert result.LogMessages == []
+
     def test_command_error(self):
         """Test sapcli command with SAPCliError."""
-        mock_conn = MagicMock()
-
-        def mock_command(conn, args):
-            console = sap.cli.core.get_console()
-            console.printout("test capture stdout")
-            console.printerr("test capture stderr")
-            raise SAPCliError("Command failed")
+        # _run_sapcli_command only forwards the connection - a bare
+        # sentinel is enough and avoids MagicMock's attribute machinery.
+        mock_conn = object()
 
-        result = mcptools._run_sapcli_command(mock_command, mock_conn, SimpleNamespace())
+        result = mcptools._run_sapcli_command(_raising_cmd, mock_conn, SimpleNamespace())
 
         assert result.Success is False
         assert result.Contents == "test capture stdout\n"
         assert result.LogMessages == ["Command failed", "test capture stderr\n"]
 
 
+# Connection arguments shared by the tool-invocation tests. Treated as
+# immutable - tests needing extra parameters build {**CONNECTION_ARGS, ...}.
+CONNECTION_ARGS = {
+    'ashost': 'localhost',
+    'client': '100',
+    'user': 'DEVELOPER',
+    'password': 'Welcome1!',
+    'port': 50001,
+    'use_ssl': True,
+    'verify_ssl': False,
+}
+
+
 class TestSapcliCommandTool:
     """Tests for the class SapcliCommandTool"""
 
+    @pytest.fixture
+    def adt_factory(self):
+        """Patched ADT connection factory returning a mock connection."""
+        with patch('sap.cli.adt_connection_from_args') as mock_factory:
+            mock_factory.return_value = MagicMock()
+            yield mock_factory
+
+    @pytest.fixture
+    def apt(self, adt_factory):
+        """Root ArgParserTool bound to the patched connection factory."""
+        return ArgParserTool('tester', None, conn_factory=adt_factory)
+
+    @pytest.fixture
+    def make_tool(self, apt):
+        """Build the tester_tool SapcliCommandTool from a configured subparser."""
+        def _make(configure, execute):
+            tester_tool_cmd = apt.add_parser('tool')
+            configure(tester_tool_cmd)
+            tester_tool_cmd.set_defaults(execute=execute)
+            return mcptools.SapcliCommandTool.from_argparser_tool(apt.tools['tester_tool'])
+
+        return _make
+
     @pytest.mark.asyncio
-    @patch('sap.cli.adt_connection_from_args')
-    async def test_default_values(self, mock_adt_connection_from_args):
+    async def test_default_values(self, make_tool):
         """Test handling tool properties with defaults.
 
            A property with default is an argument with default and the return
@@ -185,37 +344,20 @@ class TestSapcliCommandTool:
            parameters with defaults.
         """
 
-        mock_conn = MagicMock()
-        mock_adt_connection_from_args.return_value = mock_conn
-
         def tester_tool_fn(conn, args):
             # Check that the attribute exists with its default value
             assert hasattr(args, 'logical')
             assert args.logical is False
 
-        apt = ArgParserTool('tester', None, conn_factory=mock_adt_connection_from_args)
-        tester_tool_cmd = apt.add_parser('tool')
-        tester_tool_cmd.add_argument('--logical', action='store_true', default=False)
-        tester_tool_cmd.set_defaults(execute=tester_tool_fn)
-
-        tool = apt.tools['tester_tool']
-        assert tool.name == 'tester_tool'
-
-        sct = mcptools.SapcliCommandTool.from_argparser_tool(tool)
-
-        await sct.run({
-            'ashost': 'localhost',
-            'client': '100',
-            'user': 'DEVELOPER',
-            'password': 'Welcome1!',
-            'port': 50001,
-            'use_ssl': True,
-            'verify_ssl': False,
-        })
+        sct = make_tool(
+            lambda sub: sub.add_argument('--logical', action='store_true', default=False),
+            tester_tool_fn)
+        assert sct.name == 'tester_tool'
+
+        await sct.run(CONNECTION_ARGS)
 
     @pytest.mark.asyncio
-    @patch('sap.cli.adt_connection_from_args')
-    async def test_default_values_none(self, mock_adt_connection_from_args):
+    async def test_default_values_none(self, make_tool):
         """Test handling tool properties without explicit defaults.
 
            A property with nargs='?' or  nargs='*' does not need to have
@@ -223,96 +365,159 @@ class TestSapcliCommandTool:
            use None in the case the argument was not present on command line.
         """
 
-        mock_conn = MagicMock()
-        mock_adt_connection_from_args.return_value = mock_conn
-
         def tester_tool_fn(conn, args):
             # Check that the attribute exists with its default value
             assert hasattr(args, 'dnul')
             assert args.dnul is None
 
-        apt = ArgParserTool('tester', None, conn_factory=mock_adt_connection_from_args)
-        tester_tool_cmd = apt.add_parser('tool')
-        tester_tool_cmd.add_argument('--dnul', nargs='?')
-        tester_tool_cmd.set_defaults(execute=tester_tool_fn)
-
-        tool = apt.tools['tester_tool']
-        assert tool.name == 'tester_tool'
-
-        sct = mcptools.SapcliCommandTool.from_argparser_tool(tool)
-
-        await sct.run({
-            'ashost': 'localhost',
-            'client': '100',
-            'user': 'DEVELOPER',
-            'password': 'Welcome1!',
-            'port': 50001,
-            'use_ssl': True,
-            'verify_ssl': False,
-        })
+        sct = make_tool(lambda sub: sub.add_argument('--dnul', nargs='?'),
+                        tester_tool_fn)
+        assert sct.name == 'tester_tool'
+
+        await sct.run(CONNECTION_ARGS)
 
     @pytest.mark.asyncio
-    @patch('sap.cli.adt_connection_from_args')
-    async def test_missing_required_parameters(self, mock_adt_connection_from_args):
+    async def test_missing_required_parameters(self, make_tool):
         """Test that missing required parameters raise SapcliCommandToolError."""
 
-        mock_conn = MagicMock()
-        mock_adt_connection_from_args.return_value = mock_conn
-
         def tester_tool_fn(conn, args):
             pass
 
-        apt = ArgParserTool('tester', None, conn_factory=mock_adt_connection_from_args)
-        tester_tool_cmd = apt.add_parser('tool')
-        tester_tool_cmd.add_argument('--ultrastrangeunique')  # required, no default
-        tester_tool_cmd.set_defaults(execute=tester_tool_fn)
-
-        tool = apt.tools['tester_tool']
-        sct = mcptools.SapcliCommandTool.from_argparser_tool(tool)
+        sct = make_tool(
+            # required, no default
+            lambda sub: sub.add_argument('--ultrastrangeunique'),
+            tester_tool_fn)
 
         with pytest.raises(mcptools.SapcliCommandToolError) as exc_info:
-            await sct.run({
-                'ashost': 'localhost',
-                'client': '100',
-                'user': 'DEVELOPER',
-                'password': 'Welcome1!',
-                'port': 50001,
-                'use_ssl': True,
-                'verify_ssl': False,
-                # 'ultrastrangeunique' is missing
-            })
+            # 'ultrastrangeunique' is missing
+            await sct.run(CONNECTION_ARGS)
 
         assert "missing required parameters" in str(exc_info.value)
         assert "ultrastrangeunique" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('sap.cli.adt_connection_from_args')
-    async def test_argument_with_dash_in_name(self, mock_adt_connection_from_args):
+    async def test_argument_with_dash_in_name(self, make_tool):
         """Test that argument --name-with-dash is available as name_with_dash."""
 
-        mock_conn = MagicMock()
-        mock_adt_connection_from_args.return_value = mock_conn
-
         def tester_tool_fn(conn, args):
             # Check that the attribute exists with underscore name
             assert hasattr(args, 'name_with_dash')
             assert args.name_with_dash == 'test_value'
 
-        apt = ArgParserTool('tester', None, conn_factory=mock_adt_connection_from_args)
+        sct = make_tool(lambda sub: sub.add_argument('--name-with-dash'),
+                        tester_tool_fn)
+
+        await sct.run({**CONNECTION_ARGS, 'name_with_dash': 'test_value'})
+
+
+class TestBatchExecuteTool:
+    """Tests for the abap_batch_execute meta tool."""
+
+    def _make_tool(self, conn_factory, execute):
+        apt = ArgParserTool('tester', None, conn_factory=conn_factory)
         tester_tool_cmd = apt.add_parser('tool')
-        tester_tool_cmd.add_argument('--name-with-dash')
-        tester_tool_cmd.set_defaults(execute=tester_tool_fn)
-
-        tool = apt.tools['tester_tool']
-        sct = mcptools.SapcliCommandTool.from_argparser_tool(tool)
-
-        await sct.run({
-            'ashost': 'localhost',
-            'client': '100',
-            'user': 'DEVELOPER',
-            'password': 'Welcome1!',
-            'port': 50001,
-            'use_ssl': True,
-            'verify_ssl': False,
-            'name_with_dash': 'test_value',
+        tester_tool_cmd.set_defaults(execute=execute)
+        return mcptools.SapcliCommandTool.from_argparser_tool(apt.tools['tester_tool'])
+
+    @pytest.mark.asyncio
+    @patch('sap.cli.adt_connection_from_args')
+    async def test_batch_runs_calls_in_order(self, mock_adt_connection_from_args):
+        """Test that all calls run and reuse one pooled connection."""
+        mock_adt_connection_from_args.return_value = MagicMock()
+
+        executed = []
+
+        def tester_tool_fn(conn, args):
+            executed.append(conn)
+
+        sct = self._make_tool(mock_adt_connection_from_args, tester_tool_fn)
+        batch = mcptools.BatchExecuteTool.from_sapcli_tools({sct.name: sct})
+
+        result = await batch.run({
+            'calls': [
+                {'tool': 'tester_tool', 'arguments': CONNECTION_ARGS},
+                {'tool': 'tester_tool', 'arguments': CONNECTION_ARGS},
+            ],
+        })
+
+        entries = result.structured_content['result']
+        assert [entry['Success'] for entry in entries] == [True, True]
+        assert len(executed) == 2
+        mock_adt_connection_from_args.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_reports_failure(self):
+        """Test that a call naming an unregistered tool fails the entry."""
+        batch = mcptools.BatchExecuteTool.from_sapcli_tools({})
+
+        result = await batch.run({'calls': [{'tool': 'no_such_tool'}]})
+
+        entries = result.structured_content['result']
+        assert entries[0]['Success'] is False
+        assert 'no_such_tool' in entries[0]['LogMessages'][0]
+
+    @pytest.mark.asyncio
+    @patch('sap.cli.adt_connection_from_args')
+    async def test_stop_on_error(self, mock_adt_connection_from_args):
+        """Test that a failing call stops the batch by default."""
+        mock_adt_connection_from_args.return_value = MagicMock()
+
+        def failing_tool_fn(conn, args):
+            raise SAPCliError("Command failed")
+
+        sct = self._make_tool(mock_adt_connection_from_args, failing_tool_fn)
+        batch = mcptools.BatchExecuteTool.from_sapcli_tools({sct.name: sct})
+
+        result = await batch.run({
+            'calls': [
+                {'tool': 'tester_tool', 'arguments': CONNECTION_ARGS},
+                {'tool': 'tester_tool', 'arguments': CONNECTION_ARGS},
+            ],
         })
+
+        entries = result.structured_content['result']
+        assert len(entries) == 1
+        assert entries[0]['Success'] is False
+
+    @pytest.mark.asyncio
+    @patch('sap.cli.adt_connection_from_args')
+    async def test_transport_failure_fails_entry(self, mock_adt_connection_from_args):
+        """Test that a transport failure becomes a per-call failure entry."""
+        mock_adt_connection_from_args.return_value = MagicMock()
+
+        def broken_tool_fn(conn, args):
+            raise ConnectionResetError("Connection reset")
+
+        sct = self._make_tool(mock_adt_connection_from_args, broken_tool_fn)
+        batch = mcptools.BatchExecuteTool.from_sapcli_tools({sct.name: sct})
+
+        result = await batch.run({
+            'calls': [{'tool': 'tester_tool', 'arguments': CONNECTION_ARGS}],
+        })
+
+        entries = result.structured_content['result']
+        assert entries[0]['Success'] is False
+        assert 'Connection reset' in entries[0]['LogMessages'][0]
+
+
+class TestServerModule:
+    """Tests for the sapcli-mcp-server script module."""
+
+    def test_parse_args_defaults(self, server, monkeypatch):
+        """Test that both flags default to off."""
+        monkeypatch.setattr(sys, 'argv', ['sapcli-mcp-server'])
+        args = server.parse_args()
+        assert args.experimental is False
+        assert args.verbose is False
+
+    def test_parse_args_flags(self, server, monkeypatch):
+        """Test parsing of --experimental and -v."""
+        monkeypatch.setattr(sys, 'argv', ['sapcli-mcp-server', '--experimental', '-v'])
+        args = server.parse_args()
+        assert args.experimental is True
+        assert args.verbose is True
+
+    def test_verified_commands_are_abap_tools(self, server):
+        """Test that the allowlist holds abap tool names only."""
+        assert server.VERIFIED_COMMANDS
+        assert all(name.startswith('abap_') for name in server.VERIFIED_COMMANDS)